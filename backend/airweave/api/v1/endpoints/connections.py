@@ -454,6 +454,7 @@ async def send_oauth2_code(
     db: AsyncSession = Depends(deps.get_db),
     short_name: str = Body(...),
     code: str = Body(...),
+    config_fields: Optional[dict] = Body(default=None),
     user: schemas.User = Depends(deps.get_user),
 ) -> schemas.Connection:
     """Send the OAuth2 authorization code for a source.
@@ -468,6 +469,7 @@ async def send_oauth2_code(
         db: The database session
         short_name: The short name of the source
         code: The authorization code
+        config_fields: The auth config fields of the source (e.g. the Zendesk subdomain)
         user: The current user
 
     Returns:
@@ -480,6 +482,7 @@ async def send_oauth2_code(
             short_name=short_name,
             code=code,
             user=user,
+            config_fields=config_fields,
         )
     except Exception as e:
         logger.error(f"Failed to exchange OAuth2 code: {e}")
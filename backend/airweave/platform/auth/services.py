@@ -1,6 +1,7 @@
 """The services for handling OAuth2 authentication and token exchange for integrations."""
 
 import base64
+from typing import Optional
 from urllib.parse import urlencode
 from uuid import UUID
 
@@ -23,6 +24,7 @@ from airweave.platform.auth.schemas import (
     OAuth2TokenResponse,
 )
 from airweave.platform.auth.settings import integration_settings
+from airweave.platform.locator import resource_locator
 
 oauth2_service_logger = logger.with_prefix("OAuth2 Service: ").with_context(
     component="oauth2_service"
@@ -539,6 +541,7 @@ class OAuth2Service:
         short_name: str,
         code: str,
         user: schemas.User,
+        config_fields: Optional[dict] = None,
     ) -> schemas.Connection:
         """Create a new OAuth2 connection for a source.
 
@@ -554,6 +557,7 @@ class OAuth2Service:
             short_name: The short name of the source
             code: The authorization code to exchange
             user: The user creating the connection
+            config_fields: The auth config fields of the source, if it has an auth config class
 
         Returns:
         -------
@@ -570,6 +574,12 @@ class OAuth2Service:
         if not OAuth2Service._supports_oauth2(source.auth_type):
             raise HTTPException(status_code=400, detail="Source does not support OAuth2")
 
+        # Validate the auth config before the single-use code is exchanged
+        auth_fields = None
+        if source.auth_config_class:
+            auth_config_class = resource_locator.get_auth_config(source.auth_config_class)
+            auth_fields = auth_config_class(**(config_fields or {})).model_dump()
+
         # Exchange code for token using default credentials
         oauth2_response = await OAuth2Service.exchange_autorization_code_for_token(short_name, code)
 
@@ -579,6 +589,7 @@ class OAuth2Service:
             settings=settings,
             oauth2_response=oauth2_response,
             user=user,
+            auth_fields=auth_fields,
         )
 
     @staticmethod
@@ -641,14 +652,19 @@ class OAuth2Service:
         settings: BaseAuthSettings,
         oauth2_response: OAuth2TokenResponse,
         user: schemas.User,
+        auth_fields: Optional[dict] = None,
     ) -> schemas.Connection:
-        """Create a new connection with OAuth2 credentials."""
+        """Create a new connection with OAuth2 credentials.
+
+        `auth_fields` holds the validated auth config of the source, stored next to the token.
+        """
         # Prepare credentials based on auth type
         decrypted_credentials = (
             {"access_token": oauth2_response.access_token}
             if settings.auth_type == AuthType.oauth2
             else {"refresh_token": oauth2_response.refresh_token}
         )
+        decrypted_credentials.update(auth_fields or {})
 
         encrypted_credentials = credentials.encrypt(decrypted_credentials)
 
@@ -661,6 +677,7 @@ class OAuth2Service:
                 integration_type=IntegrationType.SOURCE,
                 auth_type=source.auth_type,
                 encrypted_credentials=encrypted_credentials,
+                auth_config_class=source.auth_config_class,
             )
 
             integration_credential = await crud.integration_credential.create(
@@ -112,3 +112,12 @@ class SQLServerAuthConfig(BaseDatabaseAuthConfig):
 
 class OracleAuthConfig(BaseDatabaseAuthConfig):
     """Oracle authentication configuration."""
+
+
+class ZendeskAuthConfig(AuthConfig):
+    """Zendesk account configuration, stored next to the OAuth refresh token."""
+
+    subdomain: str = Field(
+        title="Subdomain",
+        description="The subdomain of the Zendesk account, as in {subdomain}.zendesk.com",
+    )
@@ -18,11 +18,19 @@ References:
   https://developer.zendesk.com/api-reference/ticketing/tickets/ticket_comments/
 """
 
-from typing import AsyncGenerator, Dict
+import asyncio
+from contextlib import aclosing
+from datetime import datetime
+from typing import Any, AsyncGenerator, Dict, List, Optional, Set
 
 import httpx
+import msgspec
+from pydantic import TypeAdapter
+from tenacity import RetryCallState, retry, retry_if_exception, stop_after_attempt
 
+from airweave.core.logging import logger
 from airweave.platform.auth.schemas import AuthType
+from airweave.platform.configs.auth import ZendeskAuthConfig
 from airweave.platform.decorators import source
 from airweave.platform.entities._base import ChunkEntity
 from airweave.platform.entities.zendesk import (
@@ -34,7 +42,197 @@ from airweave.platform.entities.zendesk import (
 from airweave.platform.sources._base import BaseSource
 
 
-@source("Zendesk", "zendesk", AuthType.oauth2_with_refresh, labels=["Customer Service", "Support"])
+class _Meta(msgspec.Struct):
+    """Cursor pagination metadata of a Zendesk list response."""
+
+    has_more: bool = False
+
+
+class _Links(msgspec.Struct):
+    """Cursor pagination links of a Zendesk list response."""
+
+    next: Optional[str] = None
+
+
+class _ZendeskPage(msgspec.Struct):
+    """Pagination envelope shared by all Zendesk responses we page through.
+
+    Subclasses add a `records` field, renamed to the key the endpoint returns its items under.
+    """
+
+    meta: Optional[_Meta] = None
+    links: Optional[_Links] = None
+    next_page: Optional[str] = None
+    end_of_stream: bool = False
+
+
+class _ZendeskOrganization(msgspec.Struct):
+    """Fields of a Zendesk organization that are mapped onto ZendeskOrganizationEntity."""
+
+    id: int
+    name: Optional[str] = None
+    domain_names: List[str] = []
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+    details: Optional[str] = None
+    shared_tickets: bool = False
+    shared_comments: bool = False
+    external_id: Optional[str] = None
+
+
+class _ZendeskUser(msgspec.Struct):
+    """Fields of a Zendesk user that are mapped onto ZendeskUserEntity."""
+
+    id: int
+    name: Optional[str] = None
+    email: Optional[str] = None
+    role: Optional[str] = None
+    time_zone: Optional[str] = None
+    locale: Optional[str] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+    suspended: bool = False
+
+
+class _ZendeskTicket(msgspec.Struct):
+    """Fields of a Zendesk ticket that are mapped onto ZendeskTicketEntity."""
+
+    id: int
+    subject: Optional[str] = None
+    description: Optional[str] = None
+    type: Optional[str] = None
+    priority: Optional[str] = None
+    status: Optional[str] = None
+    tags: List[str] = []
+    requester_id: Optional[int] = None
+    assignee_id: Optional[int] = None
+    organization_id: Optional[int] = None
+    group_id: Optional[int] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+    due_at: Optional[datetime] = None
+    via: Optional[Dict[str, Any]] = None
+    custom_fields: List[Dict[str, Any]] = []
+
+
+class _ZendeskComment(msgspec.Struct):
+    """Fields of a Zendesk ticket comment that are mapped onto ZendeskCommentEntity.
+
+    Also used for the child events of the ticket events export, where only events with an
+    event_type of "Comment" are comments and `body` stands in for a missing `plain_body`.
+    """
+
+    id: int
+    event_type: Optional[str] = None
+    author_id: Optional[int] = None
+    plain_body: Optional[str] = None
+    body: Optional[str] = None
+    public: bool = False
+    created_at: Optional[datetime] = None
+    attachments: List[Dict[str, Any]] = []
+
+
+class _ZendeskTicketEvent(msgspec.Struct):
+    """Fields of a Zendesk ticket event from the ticket events export."""
+
+    ticket_id: int
+    created_at: Optional[datetime] = None
+    child_events: List[_ZendeskComment] = []
+
+
+class _OrganizationPage(_ZendeskPage):
+    """Page of the organizations list endpoint."""
+
+    records: List[_ZendeskOrganization] = msgspec.field(default_factory=list, name="organizations")
+
+
+class _UserPage(_ZendeskPage):
+    """Page of the users list endpoint."""
+
+    records: List[_ZendeskUser] = msgspec.field(default_factory=list, name="users")
+
+
+class _TicketPage(_ZendeskPage):
+    """Page of the tickets list endpoint."""
+
+    records: List[_ZendeskTicket] = msgspec.field(default_factory=list, name="tickets")
+
+
+class _CommentPage(_ZendeskPage):
+    """Page of the ticket comments endpoint."""
+
+    records: List[_ZendeskComment] = msgspec.field(default_factory=list, name="comments")
+
+
+class _TicketEventPage(_ZendeskPage):
+    """Page of the incremental ticket events export."""
+
+    records: List[_ZendeskTicketEvent] = msgspec.field(default_factory=list, name="ticket_events")
+
+
+# Decoders parse a response body straight into typed pages in a single pass
+_ORGANIZATION_PAGE_DECODER = msgspec.json.Decoder(_OrganizationPage)
+_USER_PAGE_DECODER = msgspec.json.Decoder(_UserPage)
+_TICKET_PAGE_DECODER = msgspec.json.Decoder(_TicketPage)
+_COMMENT_PAGE_DECODER = msgspec.json.Decoder(_CommentPage)
+_TICKET_EVENT_PAGE_DECODER = msgspec.json.Decoder(_TicketEventPage)
+
+# Adapters validate a whole page of records in a single pass instead of once per entity
+_ORGANIZATION_ADAPTER = TypeAdapter(List[ZendeskOrganizationEntity])
+_USER_ADAPTER = TypeAdapter(List[ZendeskUserEntity])
+_TICKET_ADAPTER = TypeAdapter(List[ZendeskTicketEntity])
+_COMMENT_ADAPTER = TypeAdapter(List[ZendeskCommentEntity])
+
+
+# Rate limiting and transient gateway errors, worth retrying instead of failing the sync
+_RETRY_STATUS_CODES = {429, 502, 503, 504}
+
+
+def _is_retryable(exception: BaseException) -> bool:
+    """Return whether a failed request should be retried."""
+    if isinstance(exception, TimeoutError):
+        return True
+    return (
+        isinstance(exception, httpx.HTTPStatusError)
+        and exception.response.status_code in _RETRY_STATUS_CODES
+    )
+
+
+def _wait_for_retry(retry_state: RetryCallState) -> float:
+    """Wait as long as Zendesk's Retry-After header asks, otherwise back off exponentially."""
+    exception = retry_state.outcome.exception()
+    if not isinstance(exception, httpx.HTTPStatusError):
+        return min(60, 2**retry_state.attempt_number)
+    retry_after = exception.response.headers.get("Retry-After")
+    if retry_after is not None:
+        try:
+            return float(retry_after)
+        except ValueError:
+            pass
+    return min(60, 2**retry_state.attempt_number)
+
+
+async def _cancel_task(task: asyncio.Task) -> None:
+    """Cancel a task and wait until it has finished, releasing its connection."""
+    task.cancel()
+    await asyncio.wait([task])
+    if not task.cancelled():
+        # Retrieve the outcome of a task that finished before it could be cancelled
+        task.exception()
+
+
+def _str_id(value: Any) -> Optional[str]:
+    """Convert an optional Zendesk ID to a string, keeping missing IDs as None."""
+    return str(value) if value else None
+
+
+@source(
+    "Zendesk",
+    "zendesk",
+    AuthType.oauth2_with_refresh,
+    "ZendeskAuthConfig",
+    labels=["Customer Service", "Support"],
+)
 class ZendeskSource(BaseSource):
     """Zendesk source implementation (read-only).
 
@@ -48,19 +246,117 @@ class ZendeskSource(BaseSource):
     airweave.platform.entities.zendesk.
     """
 
+    # Maximum number of in-flight comment requests, kept low to stay clear of Zendesk 429s
+    MAX_CONCURRENT_REQUESTS = 16
+    # Number of tickets whose comments are fetched concurrently before yielding
+    COMMENT_FETCH_WINDOW = 50
+    TIMEOUT_SECONDS = 30.0
+    CONNECT_TIMEOUT_SECONDS = 10.0
+    TRANSPORT_RETRIES = 2
+    PAGE_SIZE = 100
+    MAX_RETRIES = 5
+    # Upper bound on a whole request, including reading a slowly trickling body
+    REQUEST_TIMEOUT_SECONDS = 60.0
+    # Fetch comments in bulk from the ticket events export rather than once per ticket
+    BULK_COMMENT_EVENTS = True
+
     @classmethod
-    async def create(cls, access_token: str) -> "ZendeskSource":
-        """Create a new Zendesk source instance."""
+    async def create(cls, access_token: str, auth_config: ZendeskAuthConfig) -> "ZendeskSource":
+        """Create a new Zendesk source instance.
+
+        Args:
+            access_token: The OAuth access token
+            auth_config: The Zendesk account configuration stored with the connection
+        """
         instance = cls()
         instance.access_token = access_token
+        instance.subdomain = auth_config.subdomain
         return instance
 
-    async def _get_with_auth(self, client: httpx.AsyncClient, url: str) -> Dict:
-        """Make an authenticated GET request to the Zendesk API and return JSON response."""
-        headers = {"Authorization": f"Bearer {self.access_token}"}
-        response = await client.get(url, headers=headers)
+    def _create_client(self) -> httpx.AsyncClient:
+        """Create the HTTP client shared by all requests of a sync.
+
+        HTTP/2 lets the concurrent comment requests multiplex over a few connections instead
+        of paying TCP and TLS setup per request. The transport retries failed connection
+        attempts, and the Authorization header and API base URL are set once here rather than
+        per request. Absolute pagination links returned by Zendesk are used as they are.
+        """
+        limits = httpx.Limits(
+            max_connections=self.MAX_CONCURRENT_REQUESTS * 2,
+            max_keepalive_connections=self.MAX_CONCURRENT_REQUESTS,
+        )
+        transport = httpx.AsyncHTTPTransport(
+            http2=True, limits=limits, retries=self.TRANSPORT_RETRIES
+        )
+        return httpx.AsyncClient(
+            base_url=f"https://{self.subdomain}.zendesk.com/api/v2/",
+            headers={"Authorization": f"Bearer {self.access_token}"},
+            transport=transport,
+            timeout=httpx.Timeout(self.TIMEOUT_SECONDS, connect=self.CONNECT_TIMEOUT_SECONDS),
+        )
+
+    @retry(
+        retry=retry_if_exception(_is_retryable),
+        stop=stop_after_attempt(MAX_RETRIES + 1),
+        wait=_wait_for_retry,
+        reraise=True,
+    )
+    async def _get_with_auth(
+        self, client: httpx.AsyncClient, url: str, decoder: msgspec.json.Decoder
+    ) -> _ZendeskPage:
+        """Make a GET request to the Zendesk API with the authenticated client.
+
+        The raw response bytes are decoded by `decoder` into a typed page, which parses and
+        type-checks the body in one pass without building intermediate dicts for typed records.
+
+        Rate limited (429) and transient gateway errors are retried, honoring Zendesk's
+        Retry-After header, so a single throttled request does not abort the whole sync.
+        Requests that exceed REQUEST_TIMEOUT_SECONDS are cancelled and retried as well.
+        """
+        async with asyncio.timeout(self.REQUEST_TIMEOUT_SECONDS):
+            response = await client.get(url)
+        if response.status_code in _RETRY_STATUS_CODES:
+            logger.warning(f"Zendesk request to {url} failed with {response.status_code}")
         response.raise_for_status()
-        return response.json()
+        return decoder.decode(response.content)
+
+    @staticmethod
+    def _next_page_url(page: _ZendeskPage) -> Optional[str]:
+        """Return the URL of the next page, supporting cursor, offset and export pagination."""
+        if page.end_of_stream:
+            return None
+        if page.meta is not None:
+            return page.links.next if page.meta.has_more and page.links else None
+        return page.next_page
+
+    async def _paginate(
+        self, client: httpx.AsyncClient, url: str, decoder: msgspec.json.Decoder
+    ) -> AsyncGenerator[List[Any], None]:
+        """Yield the records of each page of a paginated Zendesk endpoint.
+
+        List endpoints are requested with page[size], which switches Zendesk to cursor-based
+        pagination: every page costs the same no matter how deep into the collection it is,
+        and the 10,000 record limit of offset pagination does not apply.
+
+        The request for the next page is started before the current page is handed out, so
+        its round-trip overlaps with the caller processing the current page. Callers iterate
+        pages inside aclosing(), so stopping early cancels a pending prefetch right away.
+        """
+        next_page: Optional[asyncio.Task] = None
+        try:
+            page = await self._get_with_auth(client, url, decoder)
+            while True:
+                next_url = self._next_page_url(page)
+                if next_url:
+                    next_page = asyncio.create_task(self._get_with_auth(client, next_url, decoder))
+                yield page.records
+                if next_page is None:
+                    break
+                page = await next_page
+                next_page = None
+        finally:
+            if next_page is not None:
+                await _cancel_task(next_page)
 
     async def _generate_organization_entities(
         self, client: httpx.AsyncClient
@@ -69,27 +365,26 @@ class ZendeskSource(BaseSource):
 
         GET /api/v2/organizations
         """
-        url = "https://your_subdomain.zendesk.com/api/v2/organizations.json"
-        while url:
-            data = await self._get_with_auth(client, url)
-            for org in data.get("organizations", []):
-                yield ZendeskOrganizationEntity(
-                    entity_id=str(org["id"]),
-                    name=org.get("name"),
-                    domain_names=org.get("domain_names", []),
-                    created_at=org.get("created_at"),
-                    updated_at=org.get("updated_at"),
-                    details=org.get("details"),
-                    notes=org.get("notes"),
-                    group_id=org.get("group_id"),
-                    shared_tickets=org.get("shared_tickets", False),
-                    shared_comments=org.get("shared_comments", False),
-                    external_id=org.get("external_id"),
-                    archived=False,  # Placeholder if needed
-                )
-
-            # Handle pagination
-            url = data.get("next_page")
+        url = f"organizations.json?page[size]={self.PAGE_SIZE}"
+        async with aclosing(self._paginate(client, url, _ORGANIZATION_PAGE_DECODER)) as pages:
+            async for page in pages:
+                rows = [
+                    {
+                        "entity_id": str(org.id),
+                        "name": org.name,
+                        "domain_names": org.domain_names,
+                        "created_at": org.created_at,
+                        "updated_at": org.updated_at,
+                        "details": org.details,
+                        "shared_tickets": org.shared_tickets,
+                        "shared_comments": org.shared_comments,
+                        "external_id": org.external_id,
+                    }
+                    for org in page
+                ]
+                entities = _ORGANIZATION_ADAPTER.validate_python(rows)
+                for org_entity in entities:
+                    yield org_entity
 
     async def _generate_user_entities(
         self, client: httpx.AsyncClient
@@ -98,25 +393,26 @@ class ZendeskSource(BaseSource):
 
         GET /api/v2/users
         """
-        url = "https://your_subdomain.zendesk.com/api/v2/users.json"
-        while url:
-            data = await self._get_with_auth(client, url)
-            for user in data.get("users", []):
-                yield ZendeskUserEntity(
-                    entity_id=str(user["id"]),
-                    name=user.get("name"),
-                    email=user.get("email"),
-                    role=user.get("role"),
-                    time_zone=user.get("time_zone"),
-                    locale=user.get("locale"),
-                    created_at=user.get("created_at"),
-                    updated_at=user.get("updated_at"),
-                    suspended=user.get("suspended", False),
-                    archived=False,  # Placeholder if needed
-                )
-
-            # Handle pagination
-            url = data.get("next_page")
+        url = f"users.json?page[size]={self.PAGE_SIZE}"
+        async with aclosing(self._paginate(client, url, _USER_PAGE_DECODER)) as pages:
+            async for page in pages:
+                rows = [
+                    {
+                        "entity_id": str(user.id),
+                        "name": user.name,
+                        "email": user.email,
+                        "role": user.role,
+                        "time_zone": user.time_zone,
+                        "locale": user.locale,
+                        "created_at": user.created_at,
+                        "updated_at": user.updated_at,
+                        "suspended": user.suspended,
+                    }
+                    for user in page
+                ]
+                entities = _USER_ADAPTER.validate_python(rows)
+                for user_entity in entities:
+                    yield user_entity
 
     async def _generate_ticket_entities(
         self, client: httpx.AsyncClient
@@ -125,56 +421,206 @@ class ZendeskSource(BaseSource):
 
         GET /api/v2/tickets
         """
-        url = "https://your_subdomain.zendesk.com/api/v2/tickets.json"
-        while url:
-            data = await self._get_with_auth(client, url)
-            for ticket in data.get("tickets", []):
-                yield ZendeskTicketEntity(
-                    entity_id=str(ticket["id"]),
-                    subject=ticket.get("subject"),
-                    description=ticket.get("description"),
-                    type=ticket.get("type"),
-                    priority=ticket.get("priority"),
-                    status=ticket.get("status"),
-                    tags=ticket.get("tags", []),
-                    requester_id=str(ticket.get("requester_id", "")) or None,
-                    assignee_id=str(ticket.get("assignee_id", "")) or None,
-                    organization_id=str(ticket.get("organization_id", "")) or None,
-                    group_id=str(ticket.get("group_id", "")) or None,
-                    created_at=ticket.get("created_at"),
-                    updated_at=ticket.get("updated_at"),
-                    due_at=ticket.get("due_at"),
-                    via=ticket.get("via"),
-                    custom_fields=ticket.get("custom_fields", []),
-                    archived=False,  # Placeholder if needed
-                )
-            # Handle pagination
-            url = data.get("next_page")
-
-    async def _generate_comment_entities(
-        self, client: httpx.AsyncClient, ticket_id: str
-    ) -> AsyncGenerator[ChunkEntity, None]:
-        """Generate ZendeskCommentEntity objects for comments on a given ticket.
+        url = f"tickets.json?page[size]={self.PAGE_SIZE}"
+        async with aclosing(self._paginate(client, url, _TICKET_PAGE_DECODER)) as pages:
+            async for page in pages:
+                rows = [
+                    {
+                        "entity_id": str(ticket.id),
+                        "subject": ticket.subject,
+                        "description": ticket.description,
+                        "type": ticket.type,
+                        "priority": ticket.priority,
+                        "status": ticket.status,
+                        "tags": ticket.tags,
+                        "requester_id": _str_id(ticket.requester_id),
+                        "assignee_id": _str_id(ticket.assignee_id),
+                        "organization_id": _str_id(ticket.organization_id),
+                        "group_id": _str_id(ticket.group_id),
+                        "created_at": ticket.created_at,
+                        "updated_at": ticket.updated_at,
+                        "due_at": ticket.due_at,
+                        "via": ticket.via,
+                        "custom_fields": ticket.custom_fields,
+                    }
+                    for ticket in page
+                ]
+                entities = _TICKET_ADAPTER.validate_python(rows)
+                for ticket_entity in entities:
+                    yield ticket_entity
+
+    async def _fetch_comment_entities(
+        self, client: httpx.AsyncClient, semaphore: asyncio.Semaphore, ticket_id: str
+    ) -> List[ChunkEntity]:
+        """Fetch all ZendeskCommentEntity objects for comments on a given ticket.
 
         GET /api/v2/tickets/{ticket_id}/comments
         """
+        comments = []
         # Some Zendesk accounts use /api/v2/tickets/{ticket_id}/comments.json
-        url = f"https://your_subdomain.zendesk.com/api/v2/tickets/{ticket_id}/comments.json"
+        url = f"tickets/{ticket_id}/comments.json?page[size]={self.PAGE_SIZE}"
         while url:
-            data = await self._get_with_auth(client, url)
-            for comment in data.get("comments", []):
-                yield ZendeskCommentEntity(
-                    entity_id=str(comment["id"]),
-                    ticket_id=str(ticket_id),
-                    author_id=str(comment.get("author_id", "")) or None,
-                    plain_body=comment.get("plain_body"),
-                    html_body=comment.get("html_body"),
-                    public=comment.get("public", False),
-                    created_at=comment.get("created_at"),
-                    attachments=comment.get("attachments", []),
-                    archived=False,  # Placeholder if needed
-                )
-            url = data.get("next_page")
+            async with semaphore:
+                page = await self._get_with_auth(client, url, _COMMENT_PAGE_DECODER)
+            rows = [
+                {
+                    "entity_id": str(comment.id),
+                    "ticket_id": str(ticket_id),
+                    "author_id": _str_id(comment.author_id),
+                    "plain_body": comment.plain_body,
+                    "public": comment.public,
+                    "created_at": comment.created_at,
+                    "attachments": comment.attachments,
+                }
+                for comment in page.records
+            ]
+            comments.extend(_COMMENT_ADAPTER.validate_python(rows))
+            url = self._next_page_url(page)
+        return comments
+
+    async def _fetch_comment_window(
+        self,
+        client: httpx.AsyncClient,
+        semaphore: asyncio.Semaphore,
+        ticket_ids: List[str],
+    ) -> List[List[ChunkEntity]]:
+        """Fetch the comments of a window of tickets concurrently.
+
+        Returns one list of comment entities per ticket, in ticket order. Running the fetches
+        in a TaskGroup cancels the remaining requests as soon as one of them fails.
+        """
+        async with asyncio.TaskGroup() as task_group:
+            tasks = [
+                task_group.create_task(self._fetch_comment_entities(client, semaphore, tid))
+                for tid in ticket_ids
+            ]
+        return [task.result() for task in tasks]
+
+    async def _fetch_ticket_window_entities(
+        self,
+        client: httpx.AsyncClient,
+        semaphore: asyncio.Semaphore,
+        tickets: List[ChunkEntity],
+    ) -> List[ChunkEntity]:
+        """Fetch comments for a window of tickets concurrently.
+
+        Returns each ticket entity followed by its comment entities, in ticket order.
+        """
+        comment_lists = await self._fetch_comment_window(
+            client, semaphore, [ticket.entity_id for ticket in tickets]
+        )
+        entities = []
+        for ticket, comments in zip(tickets, comment_lists, strict=True):
+            entities.append(ticket)
+            entities.extend(comments)
+        return entities
+
+    async def _generate_ticket_and_comment_entities(
+        self, client: httpx.AsyncClient
+    ) -> AsyncGenerator[ChunkEntity, None]:
+        """Generate ticket entities, each followed by the entities for its comments.
+
+        Comments are fetched for COMMENT_FETCH_WINDOW tickets at a time, with at most
+        MAX_CONCURRENT_REQUESTS requests in flight.
+        """
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_REQUESTS)
+        window: List[ChunkEntity] = []
+
+        async with aclosing(self._generate_ticket_entities(client)) as ticket_entities:
+            async for ticket_entity in ticket_entities:
+                window.append(ticket_entity)
+                if len(window) >= self.COMMENT_FETCH_WINDOW:
+                    for entity in await self._fetch_ticket_window_entities(
+                        client, semaphore, window
+                    ):
+                        yield entity
+                    window = []
+
+        if window:
+            for entity in await self._fetch_ticket_window_entities(client, semaphore, window):
+                yield entity
+
+    async def _generate_comment_event_entities(
+        self, client: httpx.AsyncClient, ticket_ids: Set[str]
+    ) -> AsyncGenerator[ChunkEntity, None]:
+        """Generate ZendeskCommentEntity objects for `ticket_ids` from the ticket events export.
+
+        GET /api/v2/incremental/ticket_events?include=comment_events
+
+        Each page carries the comments of up to 1,000 ticket events, instead of costing one
+        request per ticket. The export is only available to admin tokens.
+
+        The export also covers tickets the tickets endpoint does not return (e.g. deleted
+        ones), so only comments on `ticket_ids` are yielded. Adjacent pages of the time-based
+        export can repeat events, so comments already yielded are skipped.
+        """
+        seen_comment_ids: Set[int] = set()
+        url = "incremental/ticket_events.json?start_time=0&include=comment_events"
+        async with aclosing(self._paginate(client, url, _TICKET_EVENT_PAGE_DECODER)) as pages:
+            async for page in pages:
+                rows = []
+                for event in page:
+                    ticket_id = str(event.ticket_id)
+                    if ticket_id not in ticket_ids:
+                        continue
+                    for comment in event.child_events:
+                        if comment.event_type != "Comment" or comment.id in seen_comment_ids:
+                            continue
+                        seen_comment_ids.add(comment.id)
+                        rows.append(
+                            {
+                                "entity_id": str(comment.id),
+                                "ticket_id": ticket_id,
+                                "author_id": _str_id(comment.author_id),
+                                "plain_body": comment.plain_body or comment.body,
+                                "public": comment.public,
+                                "created_at": comment.created_at or event.created_at,
+                                "attachments": comment.attachments,
+                            }
+                        )
+                # Export pages hold up to 1,000 events, validate them off the event loop
+                entities = await asyncio.to_thread(_COMMENT_ADAPTER.validate_python, rows)
+                for comment_entity in entities:
+                    yield comment_entity
+
+    async def _generate_ticket_and_bulk_comment_entities(
+        self, client: httpx.AsyncClient
+    ) -> AsyncGenerator[ChunkEntity, None]:
+        """Generate all ticket entities, followed by the comment entities of every ticket.
+
+        Falls back to fetching comments per ticket when the token is not allowed to read the
+        ticket events export.
+        """
+        # The list keeps ticket order for the fallback, the set serves membership checks
+        ticket_id_list: List[str] = []
+        async with aclosing(self._generate_ticket_entities(client)) as ticket_entities:
+            async for ticket_entity in ticket_entities:
+                ticket_id_list.append(ticket_entity.entity_id)
+                yield ticket_entity
+        ticket_ids = set(ticket_id_list)
+
+        comments_yielded = False
+        try:
+            async with aclosing(
+                self._generate_comment_event_entities(client, ticket_ids)
+            ) as comment_entities:
+                async for comment_entity in comment_entities:
+                    comments_yielded = True
+                    yield comment_entity
+            return
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code != 403 or comments_yielded:
+                raise
+            logger.warning(
+                "Zendesk ticket events export not permitted, fetching comments per ticket"
+            )
+
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_REQUESTS)
+        for start in range(0, len(ticket_id_list), self.COMMENT_FETCH_WINDOW):
+            window = ticket_id_list[start : start + self.COMMENT_FETCH_WINDOW]
+            for comments in await self._fetch_comment_window(client, semaphore, window):
+                for comment_entity in comments:
+                    yield comment_entity
 
     async def generate_entities(self) -> AsyncGenerator[ChunkEntity, None]:
         """Generate and yield entities for Zendesk objects.
@@ -183,23 +629,25 @@ class ZendeskSource(BaseSource):
         - Organizations
         - Users
         - Tickets
-          - Comments for each ticket
+        - Comments, from the ticket events export (or after each ticket if
+          BULK_COMMENT_EVENTS is disabled)
         """
-        async with httpx.AsyncClient() as client:
+        async with self._create_client() as client:
             # 1) Yield organization entities
-            async for org_entity in self._generate_organization_entities(client):
-                yield org_entity
+            async with aclosing(self._generate_organization_entities(client)) as org_entities:
+                async for org_entity in org_entities:
+                    yield org_entity
 
             # 2) Yield user entities
-            async for user_entity in self._generate_user_entities(client):
-                yield user_entity
+            async with aclosing(self._generate_user_entities(client)) as user_entities:
+                async for user_entity in user_entities:
+                    yield user_entity
 
-            # 3) Yield ticket entities, then fetch comments for each ticket
-            async for ticket_entity in self._generate_ticket_entities(client):
-                yield ticket_entity
-
-                # Generate comment entities for this ticket
-                async for comment_entity in self._generate_comment_entities(
-                    client, ticket_entity.entity_id
-                ):
-                    yield comment_entity
+            # 3) Yield ticket entities and their comments
+            if self.BULK_COMMENT_EVENTS:
+                ticket_entities = self._generate_ticket_and_bulk_comment_entities(client)
+            else:
+                ticket_entities = self._generate_ticket_and_comment_entities(client)
+            async with aclosing(ticket_entities):
+                async for entity in ticket_entities:
+                    yield entity
@@ -164,11 +164,22 @@ class SyncContextFactory:
         current_user: schemas.User,
         source_connection: schemas.Connection,
     ) -> BaseSource:
-        """Create source instance for OAuth2 with refresh token."""
+        """Create source instance for OAuth2 with refresh token.
+
+        Sources with an auth config class (e.g. a Zendesk account subdomain) also get the
+        config stored alongside the refresh token.
+        """
         oauth2_response = await oauth2_service.refresh_access_token(
             db, source_model.short_name, current_user, source_connection.id
         )
-        return await source_class.create(oauth2_response.access_token)
+        if not source_model.auth_config_class:
+            return await source_class.create(oauth2_response.access_token)
+
+        credential = await cls._get_integration_credential(db, source_connection, current_user)
+        decrypted_credential = credentials.decrypt(credential.encrypted_credentials)
+        auth_config = resource_locator.get_auth_config(source_model.auth_config_class)
+        source_config = auth_config.model_validate(decrypted_credential)
+        return await source_class.create(oauth2_response.access_token, source_config)
 
     @classmethod
     async def _create_oauth2_source(
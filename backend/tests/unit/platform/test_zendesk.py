@@ -0,0 +1,557 @@
+"""Unit tests for the Zendesk source."""
+
+import asyncio
+import json
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+
+from airweave.platform.configs.auth import ZendeskAuthConfig
+from airweave.platform.entities.zendesk import (
+    ZendeskCommentEntity,
+    ZendeskOrganizationEntity,
+    ZendeskTicketEntity,
+    ZendeskUserEntity,
+)
+from airweave.platform.sources.zendesk import _TICKET_PAGE_DECODER, ZendeskSource
+from airweave.platform.sync.context import SyncContextFactory
+
+BASE_URL = "https://acme.zendesk.com/api/v2/"
+
+
+def json_response(body: Dict[str, Any], status_code: int = 200) -> httpx.Response:
+    """Build a JSON response as returned by the Zendesk API."""
+    return httpx.Response(
+        status_code, content=json.dumps(body).encode(), headers={"content-type": "application/json"}
+    )
+
+
+def list_page(key: str, records: List[Dict[str, Any]]) -> httpx.Response:
+    """Build the last page of a cursor-paginated list endpoint."""
+    return json_response({key: records, "meta": {"has_more": False}, "links": {"next": None}})
+
+
+def comment_event(ticket_id: int, comment_id: int, body: str = "Hello") -> Dict[str, Any]:
+    """Build a ticket event carrying a single comment, as returned by the events export."""
+    return {
+        "ticket_id": ticket_id,
+        "created_at": "2024-01-01T00:00:00Z",
+        "child_events": [
+            {"id": comment_id, "event_type": "Comment", "author_id": 7, "body": body},
+            {"id": comment_id + 1000, "event_type": "Change", "field_name": "status"},
+        ],
+    }
+
+
+async def create_source(handler: Callable[[httpx.Request], httpx.Response]) -> ZendeskSource:
+    """Create a Zendesk source whose requests are served by `handler`."""
+    source = await ZendeskSource.create("token", ZendeskAuthConfig(subdomain="acme"))
+    source._create_client = lambda: httpx.AsyncClient(
+        base_url=BASE_URL, transport=httpx.MockTransport(handler)
+    )
+    return source
+
+
+async def collect(source: ZendeskSource) -> List[Any]:
+    """Collect all entities generated by a source."""
+    return [entity async for entity in source.generate_entities()]
+
+
+class TestBulkCommentEvents:
+    """Tests for fetching comments from the ticket events export."""
+
+    @pytest.mark.asyncio
+    async def test_skips_repeated_comments_and_unknown_tickets(self):
+        """Test that repeated events and events of unlisted tickets yield no comments."""
+        event_pages = [
+            {
+                "ticket_events": [comment_event(1, 11), comment_event(2, 21)],
+                "next_page": f"{BASE_URL}incremental/ticket_events.json?start_time=100",
+                "end_of_stream": False,
+            },
+            {
+                # The time-based export repeats events on adjacent pages, and also covers
+                # tickets (e.g. deleted ones) that the tickets endpoint does not return
+                "ticket_events": [comment_event(2, 21), comment_event(3, 31)],
+                "next_page": None,
+                "end_of_stream": True,
+            },
+        ]
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            path = request.url.path
+            if path.endswith("/tickets.json"):
+                return list_page("tickets", [{"id": 1}, {"id": 2}])
+            if path.endswith("/ticket_events.json"):
+                return json_response(event_pages.pop(0))
+            return list_page(path.rsplit("/", 1)[-1].removesuffix(".json"), [])
+
+        entities = await collect(await create_source(handler))
+
+        tickets = [e for e in entities if isinstance(e, ZendeskTicketEntity)]
+        comments = [e for e in entities if isinstance(e, ZendeskCommentEntity)]
+        assert [t.entity_id for t in tickets] == ["1", "2"]
+        assert [(c.entity_id, c.ticket_id) for c in comments] == [("11", "1"), ("21", "2")]
+        assert comments[0].plain_body == "Hello"
+        assert comments[0].author_id == "7"
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_ticket_comments_when_export_forbidden(self):
+        """Test that a 403 from the export fetches the comments of each ticket, in order."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            path = request.url.path
+            if path.endswith("/tickets.json"):
+                return list_page("tickets", [{"id": 3}, {"id": 1}, {"id": 2}])
+            if path.endswith("/ticket_events.json"):
+                return json_response({"error": "Forbidden"}, status_code=403)
+            if path.endswith("/comments.json"):
+                ticket_id = int(path.split("/")[-2])
+                return list_page("comments", [{"id": ticket_id * 10, "plain_body": "Hi"}])
+            return list_page(path.rsplit("/", 1)[-1].removesuffix(".json"), [])
+
+        entities = await collect(await create_source(handler))
+
+        comments = [e for e in entities if isinstance(e, ZendeskCommentEntity)]
+        assert [(c.entity_id, c.ticket_id) for c in comments] == [
+            ("30", "3"),
+            ("10", "1"),
+            ("20", "2"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_reraises_forbidden_after_comments_were_yielded(self):
+        """Test that a 403 from the export is raised once comments have been yielded."""
+        event_pages = [
+            json_response(
+                {
+                    "ticket_events": [comment_event(1, 11)],
+                    "next_page": f"{BASE_URL}incremental/ticket_events.json?start_time=100",
+                    "end_of_stream": False,
+                }
+            ),
+            json_response({"error": "Forbidden"}, status_code=403),
+        ]
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            path = request.url.path
+            if path.endswith("/tickets.json"):
+                return list_page("tickets", [{"id": 1}])
+            if path.endswith("/ticket_events.json"):
+                return event_pages.pop(0)
+            assert not path.endswith("/comments.json")
+            return list_page(path.rsplit("/", 1)[-1].removesuffix(".json"), [])
+
+        entities = []
+        with pytest.raises(httpx.HTTPStatusError) as exc_info:
+            async for entity in (await create_source(handler)).generate_entities():
+                entities.append(entity)
+
+        assert exc_info.value.response.status_code == 403
+        comments = [e for e in entities if isinstance(e, ZendeskCommentEntity)]
+        assert [c.entity_id for c in comments] == ["11"]
+
+
+class TestPerTicketComments:
+    """Tests for fetching comments per ticket, interleaved with the tickets."""
+
+    @pytest.mark.asyncio
+    async def test_each_ticket_is_followed_by_its_comments(self):
+        """Test ticket order is kept when comment fetches of a window finish out of order."""
+        ticket_two_done = asyncio.Event()
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            path = request.url.path
+            if path.endswith("/tickets.json"):
+                return list_page("tickets", [{"id": 1}, {"id": 2}, {"id": 3}])
+            if path.endswith("/comments.json"):
+                ticket_id = int(path.split("/")[-2])
+                if ticket_id == 1:
+                    # Hold the first ticket's comments until the second ticket's have arrived
+                    await ticket_two_done.wait()
+                comments = [{"id": ticket_id * 10 + i} for i in range(2)]
+                if ticket_id == 2:
+                    ticket_two_done.set()
+                return list_page("comments", comments)
+            return list_page(path.rsplit("/", 1)[-1].removesuffix(".json"), [])
+
+        source = await create_source(handler)
+        source.BULK_COMMENT_EVENTS = False
+        source.COMMENT_FETCH_WINDOW = 2
+        # Fetching the window's comments one at a time would never get past ticket 1
+        async with asyncio.timeout(5):
+            entities = await collect(source)
+
+        assert [(type(e).__name__, e.entity_id) for e in entities] == [
+            ("ZendeskTicketEntity", "1"),
+            ("ZendeskCommentEntity", "10"),
+            ("ZendeskCommentEntity", "11"),
+            ("ZendeskTicketEntity", "2"),
+            ("ZendeskCommentEntity", "20"),
+            ("ZendeskCommentEntity", "21"),
+            ("ZendeskTicketEntity", "3"),
+            ("ZendeskCommentEntity", "30"),
+            ("ZendeskCommentEntity", "31"),
+        ]
+
+
+class TestRecordDecoding:
+    """Tests for decoding Zendesk API records into entities."""
+
+    ORGANIZATIONS = [
+        {
+            "url": "https://acme.zendesk.com/api/v2/organizations/361.json",
+            "id": 361,
+            "name": "Acme Corp",
+            "shared_tickets": True,
+            "shared_comments": False,
+            "external_id": "crm-361",
+            "created_at": "2023-04-11T09:15:02Z",
+            "updated_at": "2024-02-01T17:30:45Z",
+            "domain_names": ["acme.com", "acme.io"],
+            "details": "Enterprise plan",
+            "notes": "",
+            "group_id": None,
+            "tags": ["enterprise"],
+            "organization_fields": {"region": "emea"},
+        },
+        {
+            "url": "https://acme.zendesk.com/api/v2/organizations/362.json",
+            "id": 362,
+            "name": "Globex",
+            "shared_tickets": False,
+            "shared_comments": False,
+            "external_id": None,
+            "created_at": "2023-05-02T12:00:00Z",
+            "updated_at": "2023-05-02T12:00:00Z",
+            "domain_names": [],
+            "details": None,
+            "notes": None,
+            "group_id": None,
+            "tags": [],
+            "organization_fields": {},
+        },
+    ]
+
+    USERS = [
+        {
+            "id": 9001,
+            "url": "https://acme.zendesk.com/api/v2/users/9001.json",
+            "name": "Jane Agent",
+            "email": "jane@acme.com",
+            "created_at": "2022-11-30T08:00:00Z",
+            "updated_at": "2024-03-04T10:20:30Z",
+            "time_zone": "Amsterdam",
+            "iana_time_zone": "Europe/Amsterdam",
+            "phone": None,
+            "photo": {"content_url": "https://acme.zendesk.com/photos/9001.png"},
+            "locale_id": 1176,
+            "locale": "nl",
+            "organization_id": 361,
+            "role": "agent",
+            "verified": True,
+            "active": True,
+            "shared": False,
+            "last_login_at": "2024-03-04T10:00:00Z",
+            "suspended": False,
+            "tags": [],
+            "user_fields": {"team": "support"},
+        },
+        {
+            "id": 9002,
+            "url": "https://acme.zendesk.com/api/v2/users/9002.json",
+            "name": "End User",
+            "email": None,
+            "created_at": "2023-01-15T14:45:00Z",
+            "updated_at": "2023-01-15T14:45:00Z",
+            "time_zone": None,
+            "photo": None,
+            "locale": "en-US",
+            "organization_id": None,
+            "role": "end-user",
+            "verified": False,
+            "active": True,
+            "last_login_at": None,
+            "suspended": True,
+            "user_fields": {},
+        },
+    ]
+
+    COMMENTS = [
+        {
+            "id": 555,
+            "type": "Comment",
+            "author_id": 9002,
+            "body": "My printer is on fire!",
+            "html_body": '<div class="zd-comment"><p>My printer is on fire!</p></div>',
+            "plain_body": "My printer is on fire!",
+            "public": True,
+            "attachments": [
+                {
+                    "id": 7,
+                    "file_name": "printer.jpg",
+                    "content_url": "https://acme.zendesk.com/attachments/7/printer.jpg",
+                    "content_type": "image/jpeg",
+                    "size": 2048,
+                }
+            ],
+            "audit_id": 777,
+            "via": {"channel": "web", "source": {"from": {}, "to": {}, "rel": None}},
+            "created_at": "2024-03-05T09:00:00Z",
+            "metadata": {"system": {"client": "Mozilla/5.0"}},
+        },
+        {
+            "id": 556,
+            "type": "Comment",
+            "author_id": 9001,
+            "body": "Internal note",
+            "plain_body": "Internal note",
+            "public": False,
+            "attachments": [],
+            "created_at": "2024-03-05T09:30:00Z",
+        },
+    ]
+
+    @pytest.mark.asyncio
+    async def test_decodes_organizations_users_and_comments(self):
+        """Test that realistic records, with optional fields left out or null, map onto entities."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            path = request.url.path
+            if path.endswith("/organizations.json"):
+                return list_page("organizations", self.ORGANIZATIONS)
+            if path.endswith("/users.json"):
+                return list_page("users", self.USERS)
+            if path.endswith("/tickets.json"):
+                return list_page("tickets", [{"id": 42}])
+            return list_page("comments", self.COMMENTS)
+
+        source = await create_source(handler)
+        source.BULK_COMMENT_EVENTS = False
+        entities = await collect(source)
+
+        orgs = [e for e in entities if isinstance(e, ZendeskOrganizationEntity)]
+        assert [(o.entity_id, o.name, o.domain_names) for o in orgs] == [
+            ("361", "Acme Corp", ["acme.com", "acme.io"]),
+            ("362", "Globex", []),
+        ]
+        assert orgs[0].created_at == datetime(2023, 4, 11, 9, 15, 2, tzinfo=timezone.utc)
+        assert orgs[0].updated_at == datetime(2024, 2, 1, 17, 30, 45, tzinfo=timezone.utc)
+        assert (orgs[0].details, orgs[0].external_id) == ("Enterprise plan", "crm-361")
+        assert (orgs[0].shared_tickets, orgs[0].shared_comments) == (True, False)
+        assert (orgs[1].details, orgs[1].external_id) == (None, None)
+
+        users = [e for e in entities if isinstance(e, ZendeskUserEntity)]
+        assert [(u.entity_id, u.name, u.email, u.role) for u in users] == [
+            ("9001", "Jane Agent", "jane@acme.com", "agent"),
+            ("9002", "End User", None, "end-user"),
+        ]
+        assert (users[0].time_zone, users[0].locale, users[0].suspended) == (
+            "Amsterdam",
+            "nl",
+            False,
+        )
+        assert users[0].created_at == datetime(2022, 11, 30, 8, 0, tzinfo=timezone.utc)
+        assert (users[1].time_zone, users[1].locale, users[1].suspended) == (None, "en-US", True)
+
+        comments = [e for e in entities if isinstance(e, ZendeskCommentEntity)]
+        assert [(c.entity_id, c.ticket_id, c.author_id, c.public) for c in comments] == [
+            ("555", "42", "9002", True),
+            ("556", "42", "9001", False),
+        ]
+        assert comments[0].plain_body == "My printer is on fire!"
+        assert comments[0].created_at == datetime(2024, 3, 5, 9, 0, tzinfo=timezone.utc)
+        assert [a["file_name"] for a in comments[0].attachments] == ["printer.jpg"]
+        assert comments[1].attachments == []
+
+
+class TestNextPageUrl:
+    """Tests for following Zendesk pagination."""
+
+    @pytest.mark.parametrize(
+        "body, expected",
+        [
+            ({"meta": {"has_more": True}, "links": {"next": "next-cursor"}}, "next-cursor"),
+            ({"meta": {"has_more": False}, "links": {"next": "next-cursor"}}, None),
+            ({"meta": {"has_more": True}}, None),
+            ({"meta": {"has_more": True}, "links": None}, None),
+            ({"next_page": "next-offset"}, "next-offset"),
+            ({"next_page": "next-export", "end_of_stream": True}, None),
+        ],
+    )
+    def test_next_page_url(self, body, expected):
+        """Test the next page URL for cursor, offset and export pages."""
+        page = _TICKET_PAGE_DECODER.decode(json.dumps({"tickets": [], **body}))
+        assert ZendeskSource._next_page_url(page) == expected
+
+
+@pytest.fixture
+def retry_sleep(monkeypatch) -> AsyncMock:
+    """Record the waits between request retries instead of sleeping."""
+    sleep = AsyncMock()
+    monkeypatch.setattr(ZendeskSource._get_with_auth.retry, "sleep", sleep)
+    return sleep
+
+
+class TestGetWithAuth:
+    """Tests for retrying failed Zendesk requests."""
+
+    @staticmethod
+    async def get(handler: Callable[[httpx.Request], Any]) -> Any:
+        """Request a page of tickets from a source served by `handler`."""
+        source = await create_source(handler)
+        async with source._create_client() as client:
+            return await source._get_with_auth(client, "tickets.json", _TICKET_PAGE_DECODER)
+
+    @pytest.mark.asyncio
+    async def test_retries_rate_limited_request_after_retry_after(self, retry_sleep):
+        """Test that a 429 is retried after the delay given by Retry-After."""
+        responses = [
+            json_response({"error": "TooManyRequests"}, status_code=429),
+            list_page("tickets", [{"id": 1}]),
+        ]
+        responses[0].headers["Retry-After"] = "7"
+
+        page = await self.get(lambda request: responses.pop(0))
+
+        assert [ticket.id for ticket in page.records] == [1]
+        retry_sleep.assert_awaited_once_with(7.0)
+
+    @pytest.mark.asyncio
+    async def test_does_not_retry_client_errors(self, retry_sleep):
+        """Test that a 404 is raised without retrying."""
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return json_response({"error": "RecordNotFound"}, status_code=404)
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await self.get(handler)
+
+        assert len(requests) == 1
+        retry_sleep.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_stops_after_max_retries(self, retry_sleep):
+        """Test that a request is retried MAX_RETRIES times with exponential backoff."""
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return json_response({"error": "ServiceUnavailable"}, status_code=503)
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await self.get(handler)
+
+        assert len(requests) == ZendeskSource.MAX_RETRIES + 1
+        assert [call.args[0] for call in retry_sleep.await_args_list] == [2, 4, 8, 16, 32]
+
+    @pytest.mark.asyncio
+    async def test_backs_off_when_retry_after_is_not_a_number(self, retry_sleep):
+        """Test that an unparseable Retry-After falls back to exponential backoff."""
+        responses = [
+            json_response({"error": "TooManyRequests"}, status_code=429),
+            list_page("tickets", []),
+        ]
+        responses[0].headers["Retry-After"] = "Wed, 21 Oct 2015 07:28:00 GMT"
+
+        await self.get(lambda request: responses.pop(0))
+
+        retry_sleep.assert_awaited_once_with(2)
+
+    @pytest.mark.asyncio
+    async def test_retries_timed_out_request(self, retry_sleep, monkeypatch):
+        """Test that a request exceeding REQUEST_TIMEOUT_SECONDS is retried."""
+        monkeypatch.setattr(ZendeskSource, "REQUEST_TIMEOUT_SECONDS", 0.01)
+        calls = []
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request)
+            if len(calls) == 1:
+                await asyncio.sleep(1)
+            return list_page("tickets", [{"id": 1}])
+
+        page = await self.get(handler)
+
+        assert [ticket.id for ticket in page.records] == [1]
+        assert len(calls) == 2
+        retry_sleep.assert_awaited_once_with(2)
+
+
+class TestCreateClient:
+    """Tests for the Zendesk HTTP client."""
+
+    @pytest.mark.asyncio
+    async def test_uses_subdomain_as_base_url(self):
+        """Test that requests are made against the account's subdomain."""
+        source = await ZendeskSource.create("token", ZendeskAuthConfig(subdomain="acme"))
+        async with source._create_client() as client:
+            assert str(client.base_url) == BASE_URL
+            assert client.headers["Authorization"] == "Bearer token"
+
+    @pytest.mark.asyncio
+    async def test_sync_context_passes_stored_subdomain(self):
+        """Test that a sync creates the source with the subdomain stored on the connection."""
+        source_model = MagicMock(short_name="zendesk", auth_config_class="ZendeskAuthConfig")
+        credential = MagicMock(encrypted_credentials="encrypted")
+        with (
+            patch(
+                "airweave.platform.sync.context.oauth2_service.refresh_access_token",
+                AsyncMock(return_value=MagicMock(access_token="token")),
+            ),
+            patch.object(
+                SyncContextFactory,
+                "_get_integration_credential",
+                AsyncMock(return_value=credential),
+            ),
+            patch(
+                "airweave.platform.sync.context.credentials.decrypt",
+                return_value={"refresh_token": "refresh", "subdomain": "acme"},
+            ),
+        ):
+            source = await SyncContextFactory._create_oauth2_with_refresh_source(
+                MagicMock(), source_model, ZendeskSource, MagicMock(), MagicMock()
+            )
+
+        async with source._create_client() as client:
+            assert str(client.base_url) == BASE_URL
+
+
+class TestPagination:
+    """Tests for prefetching the next page of a Zendesk list."""
+
+    @pytest.mark.asyncio
+    async def test_closing_entity_generator_cancels_prefetch(self):
+        """Test that closing an entity generator early cancels the pending next page request."""
+        prefetch_started = asyncio.Event()
+        prefetch_cancelled = asyncio.Event()
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            if "cursor" not in request.url.params:
+                return json_response(
+                    {
+                        "tickets": [{"id": 1}],
+                        "meta": {"has_more": True},
+                        "links": {"next": f"{BASE_URL}tickets.json?cursor=2"},
+                    }
+                )
+            prefetch_started.set()
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                prefetch_cancelled.set()
+                raise
+
+        source = await create_source(handler)
+        async with source._create_client() as client:
+            tickets = source._generate_ticket_entities(client)
+            first = await anext(tickets)
+            await prefetch_started.wait()
+            await tickets.aclose()
+
+            assert first.entity_id == "1"
+            assert prefetch_cancelled.is_set()